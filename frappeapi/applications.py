@@ -1,3 +1,4 @@
+import json
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
 
@@ -14,12 +15,56 @@ from frappeapi.fast_routes import (
 	PATCH as _fast_patch,
 	POST as _fast_post,
 	PUT as _fast_put,
+	install as _install_fast_routes,
 	register_app,
 )
 from frappeapi.responses import JSONResponse
 from frappeapi.routing import APIRouter
 
 
+def _verb_decorator(name: str, starlette_reg: Callable[[str], Callable[[Callable], Callable]]) -> Callable:
+	"""
+	Build the `FrappeAPI.<name>` decorator for one HTTP verb.
+
+	Every verb takes the same arguments and forwards them to `FrappeAPI._dual` together with
+	the matching `fast_routes` factory and `APIRouter` method.
+	"""
+
+	def verb(
+		self: "FrappeAPI",
+		path: str,
+		*,
+		response_model: Any = Default(None),
+		status_code: Optional[int] = None,
+		description: Optional[str] = None,
+		tags: Optional[List[Union[str, Enum]]] = None,
+		summary: Optional[str] = None,
+		include_in_schema: bool = True,
+		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
+		# Frappe parameters
+		allow_guest: bool = False,
+		xss_safe: bool = False,
+	):
+		return self._dual(
+			starlette_reg,
+			getattr(self.router, name),
+			path=path,
+			response_model=response_model,
+			status_code=status_code,
+			description=description,
+			tags=tags,
+			summary=summary,
+			include_in_schema=include_in_schema,
+			response_class=response_class,
+			allow_guest=allow_guest,
+			xss_safe=xss_safe,
+		)
+
+	verb.__name__ = name
+	verb.__qualname__ = f"FrappeAPI.{name}"
+	return verb
+
+
 class FrappeAPI:
 	def __init__(
 		self,
@@ -63,7 +108,10 @@ class FrappeAPI:
 		self.exception_handlers: Dict[Type[Exception], Callable[[WerkzeugRequest, Exception], WerkzeugResponse]] = (
 			{} if exception_handlers is None else dict(exception_handlers)  # type: ignore
 		)
-		self.router = APIRouter(
+		# The APIRouter is only built on first use (see `router`); apps that are imported but never
+		# declare a route or serve OpenAPI in this process skip it entirely.
+		self._router: Optional[APIRouter] = None
+		self._router_kwargs: Dict[str, Any] = dict(
 			title=self.title,
 			version=self.version,
 			openapi_version=self.openapi_version,
@@ -81,14 +129,34 @@ class FrappeAPI:
 			fastapi_path_format=self.fastapi_path_format,
 		)
 		self.openapi_schema: Optional[Dict[str, Any]] = None
+		self._openapi_bytes: Optional[bytes] = None
 
 		register_app(self)
+		if self.fastapi_path_format:
+			_install_fast_routes()
+
+	@property
+	def router(self) -> APIRouter:
+		if self._router is None:
+			self._router = APIRouter(**self._router_kwargs)
+		return self._router
 
 	def openapi(self) -> Dict[str, Any]:
 		if self.openapi_schema is None:
 			self.openapi_schema = self.router.openapi()
 		return self.openapi_schema
 
+	def openapi_json_bytes(self) -> bytes:
+		"""
+		Return the OpenAPI schema serialized as JSON.
+
+		The encoded bytes are cached alongside the schema, so an `/openapi.json` handler can
+		write them out as `application/json` without re-serializing the schema on every hit.
+		"""
+		if self._openapi_bytes is None:
+			self._openapi_bytes = json.dumps(self.openapi()).encode()
+		return self._openapi_bytes
+
 	# ------------------------------------------------------------------ #
 	# Hybrid decorator helpers
 	# ------------------------------------------------------------------ #
@@ -174,215 +242,13 @@ class FrappeAPI:
 	# Public HTTP verb decorators
 	# ------------------------------------------------------------------ #
 
-	def get(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_get,
-			self.router.get,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def post(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_post,
-			self.router.post,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def put(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_put,
-			self.router.put,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def delete(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_delete,
-			self.router.delete,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def patch(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_patch,
-			self.router.patch,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def options(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_options,
-			self.router.options,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
-
-	def head(
-		self,
-		path: str,
-		*,
-		response_model: Any = Default(None),
-		status_code: Optional[int] = None,
-		description: Optional[str] = None,
-		tags: Optional[List[Union[str, Enum]]] = None,
-		summary: Optional[str] = None,
-		include_in_schema: bool = True,
-		response_class: Type[WerkzeugResponse] = Default(JSONResponse),
-		# Frappe parameters
-		allow_guest: bool = False,
-		xss_safe: bool = False,
-	):
-		return self._dual(
-			_fast_head,
-			self.router.head,
-			path=path,
-			response_model=response_model,
-			status_code=status_code,
-			description=description,
-			tags=tags,
-			summary=summary,
-			include_in_schema=include_in_schema,
-			response_class=response_class,
-			allow_guest=allow_guest,
-			xss_safe=xss_safe,
-		)
+	get = _verb_decorator("get", _fast_get)
+	post = _verb_decorator("post", _fast_post)
+	put = _verb_decorator("put", _fast_put)
+	delete = _verb_decorator("delete", _fast_delete)
+	patch = _verb_decorator("patch", _fast_patch)
+	options = _verb_decorator("options", _fast_options)
+	head = _verb_decorator("head", _fast_head)
 
 	def exception_handler(self, exc_class: Type[Exception]) -> Callable:
 		"""
@@ -12,27 +12,36 @@ Purpose
 How it works
 --------------
 1. Each FrappeAPI instance registers routes in its self.router.routes collection.
-2. At import time we monkey-patch **`frappe.api.handle`**:
-   - For every `/api/**` request we check against the registered routes.
+2. Every FastAPI-style route is also added, once, to the flat `_ALL_FASTAPI_ROUTES`
+   table and inserted into a per-method segment trie (`_ROUTER_TRIE`) at decoration
+   time. Templates that cannot be split into whole segments (e.g. "/files/{name}.json")
+   are kept in per-method fallback lists.
+3. The first FrappeAPI created with `fastapi_path_format=True` calls `install()`,
+   which monkey-patches **`frappe.api.handle`** exactly once:
+   - For every `/api/**` request we walk the trie segment by segment.
    - On a match, we extract path parameters and call the corresponding handler.
    - If nothing matches we fall back to the original `frappe.api.handle`.
 """
 
 from __future__ import annotations
 
+import re
 import types
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple, Type, Union
 
 if TYPE_CHECKING:
 	from unittest.mock import Mock
 
+	from frappeapi.routing import APIRoute
+
 	frappe = Mock()
 else:
 	import frappe
 
 from fastapi.datastructures import Default
-from starlette.routing import Match, Route
+from starlette.convertors import CONVERTOR_TYPES, Convertor
+from starlette.routing import PARAM_REGEX, compile_path
 from werkzeug.wrappers import Response as WerkzeugResponse
 
 from frappeapi.responses import JSONResponse
@@ -46,15 +55,249 @@ __all__ = [
 	"OPTIONS",
 	"HEAD",
 	"register_app",
+	"rebuild_route_index",
+	"build_dispatch",
+	"install",
 ]
 
 _FRAPPEAPI_INSTANCES = []
+# id() of every registered app, for O(1) dedupe; the list above keeps registration order.
+_FRAPPEAPI_INSTANCE_IDS: Set[int] = set()
+
+# Every FastAPI-style route across all registered apps as (methods, path, api_route), read
+# off the APIRoute once when it is added: `methods` is upper-cased (GET also answers HEAD,
+# as in Starlette) and `path` is relative to `/api`. The structures below index this table.
+_ALL_FASTAPI_ROUTES: List[Tuple[FrozenSet[str], str, APIRoute]] = []
+
+# Reserved trie keys. Literal segments are plain strings, so tuples never collide with them.
+_PARAM = ("__param__",)  # [(name, matcher, convertor, child), ...] for "{name}" segments
+_WILD = ("__wild__",)  # [(name, convertor, api_route), ...] for a trailing "{name:path}"
+_ROUTE = ("__route__",)  # The APIRoute that terminates at this node
+
+# {method: root node}, each node being {segment: child node, _PARAM: ..., _WILD: ..., _ROUTE: ...}
+_ROUTER_TRIE: Dict[str, Dict[Any, Any]] = {}
+# Routes whose template does not split into whole segments, partitioned by method as
+# (path, param_convertors, api_route) entries in registration order.
+_ROUTES_BY_METHOD: Dict[str, List[Tuple[str, Dict[str, Convertor], APIRoute]]] = {}
+# Per method, those routes compiled into one `(?P<r0>...)$|(?P<r1>...)$|...` pattern plus a
+# {"r0": ([(group, param_name, convertor), ...], api_route), ...} table keyed by the matched
+# alternative. Built by build_dispatch() (or lazily on first use) and dropped on registration.
+_DISPATCH_BY_METHOD: Dict[str, Tuple[Pattern[str], Dict[str, Tuple[List[Tuple[str, str, Convertor]], APIRoute]]]] = {}
+
+# Direct-mapped cache of recently resolved requests, indexed by hash((method, path)) & _HOT_CACHE_MASK.
+# Entries are (routes_version, method, path, api_route, path_params_items) and are verified on hit;
+# bumping _ROUTES_VERSION on registration invalidates all of them at once.
+_HOT_CACHE_MASK = 0xFF
+_HOT_CACHE: List[Optional[Tuple[int, str, str, APIRoute, Tuple[Tuple[str, Any], ...]]]] = [None] * (_HOT_CACHE_MASK + 1)
+_ROUTES_VERSION = 0
+
+# Set once install() has patched frappe.api.handle in this process.
+_installed = False
+
+# A parsed template segment: a literal string or a (name, convertor_type, convertor) tuple.
+_Segment = Union[str, Tuple[str, str, Convertor]]
 
 
 def register_app(app):
 	"""Register a FrappeAPI instance to be considered for routing."""
-	if app not in _FRAPPEAPI_INSTANCES:
+	app_id = id(app)
+	if app_id not in _FRAPPEAPI_INSTANCE_IDS:
+		_FRAPPEAPI_INSTANCE_IDS.add(app_id)
 		_FRAPPEAPI_INSTANCES.append(app)
+		known = {id(entry[2]) for entry in _ALL_FASTAPI_ROUTES}
+		for api_route in _app_routes(app):
+			if _is_fastapi_route(api_route) and id(api_route) not in known:
+				_add_route(api_route)
+
+
+def rebuild_route_index() -> None:
+	"""
+	Rebuild the dispatch tables from the routes of every registered app.
+
+	Routes created through the app decorators are indexed as they are declared; call this
+	after appending to `app.router.routes` directly.
+	"""
+	global _ROUTES_VERSION
+	_ALL_FASTAPI_ROUTES.clear()
+	_ROUTER_TRIE.clear()
+	_ROUTES_BY_METHOD.clear()
+	_DISPATCH_BY_METHOD.clear()
+	_ROUTES_VERSION += 1
+	for app in _FRAPPEAPI_INSTANCES:
+		for api_route in _app_routes(app):
+			if _is_fastapi_route(api_route):
+				_add_route(api_route)
+
+
+def _app_routes(app) -> List[APIRoute]:
+	# FrappeAPI builds its APIRouter on first use; an app that never did has no routes yet.
+	router = getattr(app, "_router", None)
+	return router.routes if router is not None else []
+
+
+def _is_fastapi_route(api_route: APIRoute) -> bool:
+	return bool(
+		getattr(api_route, "fastapi_path_format_flag", False)
+		and getattr(api_route, "path_for_starlette_matching", None)
+	)
+
+
+def _add_route(api_route: APIRoute) -> None:
+	"""Add a FastAPI-style route to the flat table and index it for each of its methods."""
+	methods = frozenset(method.upper() for method in api_route.methods)
+	if "GET" in methods:
+		methods |= {"HEAD"}
+	entry = (methods, api_route.path_for_starlette_matching, api_route)
+	_ALL_FASTAPI_ROUTES.append(entry)
+	_register_route(*entry)
+
+
+def _register_route(methods: FrozenSet[str], path: str, api_route: APIRoute) -> None:
+	"""
+	Insert a FastAPI-style route into the dispatch trie of each of `methods`.
+
+	`path` is the template relative to `/api`, e.g. "/items/{item_id}". It is parsed once
+	and shared by every method. The first route registered for a given template wins,
+	mirroring the previous first-match scan.
+	"""
+	global _ROUTES_VERSION
+	_ROUTES_VERSION += 1
+
+	segments: List[_Segment] = []
+	for index, segment in enumerate(path.split("/")[1:]):
+		param = PARAM_REGEX.fullmatch(segment)
+		if param is None:
+			if "{" in segment:
+				break
+			segments.append(segment)
+			continue
+
+		name, convertor_type = param.group(1), (param.group(2) or ":str")[1:]
+		assert convertor_type in CONVERTOR_TYPES, f"Unknown path convertor '{convertor_type}'"
+		segments.append((name, convertor_type, CONVERTOR_TYPES[convertor_type]))
+		if convertor_type == "path" and index != path.count("/") - 1:
+			break
+	else:
+		for method in methods:
+			_insert(_ROUTER_TRIE.setdefault(method, {}), segments, api_route)
+		return
+
+	# The template does not split into whole segments (e.g. "/files/{name}.json").
+	_, _, param_convertors = compile_path(path)
+	for method in methods:
+		_ROUTES_BY_METHOD.setdefault(method, []).append((path, param_convertors, api_route))
+		_DISPATCH_BY_METHOD.pop(method, None)
+
+
+def _insert(node: Dict[Any, Any], segments: List[_Segment], api_route: APIRoute) -> None:
+	for segment in segments:
+		if isinstance(segment, str):
+			node = node.setdefault(segment, {})
+			continue
+
+		name, convertor_type, convertor = segment
+		if convertor_type == "path":
+			node.setdefault(_WILD, []).append((name, convertor, api_route))
+			return
+
+		params = node.setdefault(_PARAM, [])
+		for param_name, _, param_convertor, child in params:
+			if param_name == name and param_convertor is convertor:
+				node = child
+				break
+		else:
+			child = {}
+			params.append((name, re.compile(convertor.regex).fullmatch, convertor, child))
+			node = child
+
+	node.setdefault(_ROUTE, api_route)
+
+
+def _match(node: Dict[Any, Any], segments: List[str], index: int, path_params: Dict[str, Any]) -> Optional[APIRoute]:
+	"""Walk the trie from `node`, preferring literal segments over parameters, then catch-alls."""
+	if index == len(segments):
+		return node.get(_ROUTE)
+
+	segment = segments[index]
+	child = node.get(segment)
+	if child is not None:
+		api_route = _match(child, segments, index + 1, path_params)
+		if api_route is not None:
+			return api_route
+
+	for name, matcher, convertor, child in node.get(_PARAM, ()):
+		if matcher(segment):
+			api_route = _match(child, segments, index + 1, path_params)
+			if api_route is not None:
+				path_params[name] = convertor.convert(segment)
+				return api_route
+
+	for name, convertor, api_route in node.get(_WILD, ()):
+		path_params[name] = convertor.convert("/".join(segments[index:]))
+		return api_route
+
+	return None
+
+
+def _resolve(method: str, path: str) -> Tuple[Optional[APIRoute], Dict[str, Any]]:
+	"""Find the route for `method` and `path` (relative to `/api`), trie first, then the fallback list."""
+	path_params: Dict[str, Any] = {}
+	root = _ROUTER_TRIE.get(method)
+	if root is not None:
+		api_route = _match(root, path.split("/")[1:], 0, path_params)
+		if api_route is not None:
+			return api_route, path_params
+
+	dispatch = _DISPATCH_BY_METHOD.get(method)
+	if dispatch is None:
+		if method not in _ROUTES_BY_METHOD:
+			return None, path_params
+		dispatch = _build_method_dispatch(method)
+
+	pattern, alternatives = dispatch
+	match = pattern.match(path)
+	if match is None:
+		return None, path_params
+
+	# The outer alternative group closes last, so lastgroup names the route that matched.
+	groups, api_route = alternatives[match.lastgroup]
+	return api_route, {name: convertor.convert(match.group(group)) for group, name, convertor in groups}
+
+
+def build_dispatch() -> None:
+	"""
+	Compile the fallback routes of every method into their combined patterns.
+
+	Dispatch builds a method's pattern on first use anyway; call this after all routes are
+	declared to pay that cost up front.
+	"""
+	for method in list(_ROUTES_BY_METHOD):
+		_build_method_dispatch(method)
+
+
+def _build_method_dispatch(
+	method: str,
+) -> Tuple[Pattern[str], Dict[str, Tuple[List[Tuple[str, str, Convertor]], APIRoute]]]:
+	# Same regex as Starlette's compile_path, but with group names prefixed by the route's
+	# alternative so that parameters with the same name in different routes do not clash.
+	patterns: List[str] = []
+	alternatives: Dict[str, Tuple[List[Tuple[str, str, Convertor]], APIRoute]] = {}
+	for index, (path, param_convertors, api_route) in enumerate(_ROUTES_BY_METHOD[method]):
+		alternative = f"r{index}"
+		regex, groups, start = "", [], 0
+		for param in PARAM_REGEX.finditer(path):
+			name = param.group(1)
+			group = f"{alternative}_{name}"
+			regex += re.escape(path[start : param.start()]) + f"(?P<{group}>{param_convertors[name].regex})"
+			groups.append((group, name, param_convertors[name]))
+			start = param.end()
+		regex += re.escape(path[start:])
+		patterns.append(f"(?P<{alternative}>{regex})$")
+		alternatives[alternative] = (groups, api_route)
+
+	dispatch = (re.compile("|".join(patterns)), alternatives)
+	_DISPATCH_BY_METHOD[method] = dispatch
+	return dispatch
 
 
 def _factory(methods: List[str]) -> Callable:
@@ -90,8 +333,18 @@ OPTIONS = _factory(["OPTIONS"])
 HEAD = _factory(["HEAD"])
 
 
-def _install_patch() -> None:
-	"""Install the patch to frappe.api.handle once per process."""
+def install() -> None:
+	"""
+	Install the patch to frappe.api.handle once per process.
+
+	Called by FrappeAPI apps that use FastAPI-style paths, so processes that only serve dotted
+	paths never wrap the handler. Nothing is installed during migrations or before `frappe.api`
+	is loaded; a later call tries again.
+	"""
+	global _installed
+	if _installed:
+		return
+
 	if hasattr(frappe, "flags") and getattr(frappe.flags, "in_migrate", False):
 		return
 
@@ -103,61 +356,47 @@ def _install_patch() -> None:
 
 	orig_handle = frappe.api.handle
 
-	def patched_handle(request=None) -> types.ModuleType | dict:
-		request_path = frappe.local.request.path
-
-		for app_instance in _FRAPPEAPI_INSTANCES:
-			if not app_instance.fastapi_path_format:
-				continue
-
-			if not (
-				request_path.startswith("/api/")
-				and not request_path.startswith("/api/method/")
-				and not request_path.startswith("/api/resource/")
-			):
-				continue
-
-			path_segment_to_match = request_path[4:]
-
-			if not hasattr(app_instance, "router") or not hasattr(app_instance.router, "routes"):
-				continue
-
-			for api_route in app_instance.router.routes:
-				# api_route.fastapi_path_format_flag is the mode of the APIRoute instance itself.
-				# api_route.path_for_starlette_matching is the relative path like "/items/{item_id}".
-				if not (api_route.fastapi_path_format_flag and api_route.path_for_starlette_matching):
-					continue
-
-				scope = {
-					"type": "http",
-					"path": path_segment_to_match,
-					"root_path": "",
-					"method": frappe.local.request.method.upper(),
-				}
-
-				# Create a temporary Starlette route for matching.
-				starlette_route = Route(
-					api_route.path_for_starlette_matching,
-					endpoint=api_route.endpoint,
-					methods=[m for m in api_route.methods] if api_route.methods else None,
-				)
-
-				match, child_scope = starlette_route.matches(scope)
-				if match == Match.FULL:
-					path_params = child_scope.get("path_params", {})
-					frappe.local.request.path_params = path_params
-					response = api_route.handle_request()
-					return response
-
-		# No FastAPI-style route matched for any app instance in FastAPI mode,
-		# or the path was not a FastAPI-style candidate.
-		# Fall back to the original Frappe handler for dotted paths or other unhandled /api/ calls.
+	def call_orig_handle(request=None) -> types.ModuleType | dict:
 		if request:
 			return orig_handle(request)
 		return orig_handle()
 
+	def patched_handle(request=None) -> types.ModuleType | dict:
+		# frappe.local is a thread-local proxy; dereference it once per request.
+		local_request = frappe.local.request
+		request_path = local_request.path
+
+		# Dotted paths and Frappe's own REST endpoints can never match a FastAPI-style route,
+		# so they go straight to the original handler without touching the route registry.
+		if not request_path.startswith("/api/") or request_path.startswith(("/api/method/", "/api/resource/")):
+			return call_orig_handle(request)
+
+		path_segment_to_match = request_path[4:]
+		method = local_request.method.upper()
+
+		slot = hash((method, path_segment_to_match)) & _HOT_CACHE_MASK
+		cached = _HOT_CACHE[slot]
+		if (
+			cached is not None
+			and cached[0] == _ROUTES_VERSION
+			and cached[1] == method
+			and cached[2] == path_segment_to_match
+		):
+			api_route, path_params = cached[3], cached[4]
+		else:
+			api_route, resolved_params = _resolve(method, path_segment_to_match)
+			if api_route is None:
+				# No FastAPI-style route matched; let Frappe handle any other /api/ call.
+				return call_orig_handle(request)
+			path_params = tuple(resolved_params.items())
+			_HOT_CACHE[slot] = (_ROUTES_VERSION, method, path_segment_to_match, api_route, path_params)
+
+		# Parameterless routes skip this entirely: parse_and_validate_request treats a missing
+		# `path_params` attribute as empty. Handlers always get a fresh dict, never the cached items.
+		if path_params:
+			local_request.path_params = dict(path_params)
+		return api_route.handle_request()
+
 	frappe.api.handle = patched_handle
 	frappe._fastapi_path_patch_done = True
-
-
-_install_patch()
+	_installed = True
@@ -72,6 +72,7 @@ from frappeapi.exception_handler import (
 	response_validation_exception_handler,
 )
 from frappeapi.exceptions import FrappeAPIError, HTTPException, RequestValidationError, ResponseValidationError
+from frappeapi.fast_routes import _add_route
 from frappeapi.responses import JSONResponse, PlainTextResponse
 from frappeapi.utils import extract_endpoint_relative_path
 
@@ -285,6 +286,15 @@ def request_body_to_args(
 	return values, errors
 
 
+def _new_sub_response() -> WerkzeugResponse:
+	response = WerkzeugResponse()
+	if "content-length" in response.headers:
+		del response.headers["content-length"]
+
+	response.status = 200
+	return response
+
+
 def parse_and_validate_request(
 	*,
 	request: WerkzeugRequest,
@@ -301,11 +311,7 @@ def parse_and_validate_request(
 	values: Dict[str, Any] = {}
 	errors: List[Any] = []
 	if response is None:
-		response = WerkzeugResponse()
-		if "content-length" in response.headers:
-			del response.headers["content-length"]
-
-		response.status = 200
+		response = _new_sub_response()
 
 	# TODO: Request Query Params
 	request_query_params = QueryParams(request.query_string)
@@ -405,6 +411,14 @@ class APIRoute(FastAPIRoute):
 			self.prefix + "/" + extract_endpoint_relative_path(self.endpoint) + "." + self.endpoint.__name__
 		)
 
+		# Probed once here instead of on every handle_request call.
+		self._warn_on_dotted_path_call = bool(
+			not self.fastapi_path_format_flag
+			and self.user_defined_fastapi_path_segment
+			and "{" in self.user_defined_fastapi_path_segment
+			and "}" in self.user_defined_fastapi_path_segment
+		)
+
 		self.path_for_starlette_matching: Optional[str] = None
 		self.full_fastapi_path_for_openapi: Optional[str] = None
 
@@ -439,7 +453,8 @@ class APIRoute(FastAPIRoute):
 		self.response_model_exclude_defaults = response_model_exclude_defaults
 		self.response_model_exclude_none = response_model_exclude_none
 		self.include_in_schema = include_in_schema
-		self.response_class = response_class
+		# Unwrap the Default(...) sentinel once here rather than on every request.
+		self.response_class = response_class.value if isinstance(response_class, DefaultPlaceholder) else response_class
 		self.dependency_overrides_provider = dependency_overrides_provider
 		self.callbacks = callbacks
 		self.openapi_extra = openapi_extra
@@ -528,15 +543,21 @@ class APIRoute(FastAPIRoute):
 
 		self.exception_handlers = {} if exception_handlers is None else exception_handlers
 
+		# Endpoints without any path, query, header, cookie or body parameters (e.g. health checks)
+		# have nothing to parse or validate, so handle_request skips building query params and headers.
+		self._is_trivial = not (
+			self._flat_dependant.path_params
+			or self._flat_dependant.query_params
+			or self._flat_dependant.header_params
+			or self._flat_dependant.cookie_params
+			or self._flat_dependant.body_params
+			or self.body_field
+		)
+
 	def handle_request(self, *args, **kwargs) -> WerkzeugResponse:
 		# Runtime warning if a dotted path is called for an endpoint that was
 		# defined with FastAPI-style path parameters when fastapi_path_format is False.
-		if (
-			not self.fastapi_path_format_flag
-			and self.user_defined_fastapi_path_segment
-			and "{" in self.user_defined_fastapi_path_segment
-			and "}" in self.user_defined_fastapi_path_segment
-		):
+		if self._warn_on_dotted_path_call:
 			import warnings
 
 			warnings.warn(
@@ -676,13 +697,18 @@ class APIRoute(FastAPIRoute):
 
 		with ExitStack() as exit_stack_validation:
 			try:
-				solved_result = parse_and_validate_request(
-					request=request,
-					dependant=self.dependant,
-					body=parsed_structured_body,
-					exit_stack=exit_stack_validation,
-					embed_body_fields=self._embed_body_fields,
-				)
+				if self._is_trivial:
+					solved_result = SolvedDependency(
+						values={}, errors=[], background_tasks=None, response=_new_sub_response(), dependency_cache={}
+					)
+				else:
+					solved_result = parse_and_validate_request(
+						request=request,
+						dependant=self.dependant,
+						body=parsed_structured_body,
+						exit_stack=exit_stack_validation,
+						embed_body_fields=self._embed_body_fields,
+					)
 				errors_validation = solved_result.errors
 				if not errors_validation:
 					request_data = solved_result.values
@@ -711,12 +737,7 @@ class APIRoute(FastAPIRoute):
 							exclude_none=self.response_model_exclude_none,
 						)
 
-						if isinstance(self.response_class, DefaultPlaceholder):
-							actual_response_class = self.response_class.value
-						else:
-							actual_response_class = self.response_class
-
-						response = actual_response_class(content, **response_args)
+						response = self.response_class(content, **response_args)
 						if not is_body_allowed_for_status_code(response.status_code):
 							response.data = b""
 
@@ -906,6 +927,8 @@ class APIRouter:
 				user_defined_fastapi_path_segment=path,
 			)
 			self.routes.append(route)
+			if route.fastapi_path_format_flag and route.path_for_starlette_matching:
+				_add_route(route)
 
 			# When the route is called, it will be handled by the route's handle_request method
 			@whitelist(methods=methods, allow_guest=allow_guest, xss_safe=xss_safe)